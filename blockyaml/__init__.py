@@ -26,20 +26,18 @@ from .converters import (
 )
 from .parsers import Parser, SimpleParser, YAMLParserError
 
-assert all(
-    (
-        Converter,
-        ConverterRegistry,
-        DataclassConverter,
-        types,
-        YAMLConstructorError,
-        YAMLRepresenterError,
-        YAMLConversionError,
-        YAMLParserError,
-        YAMLDataclassFieldError,
-        YAMLDataclassMissingFieldsError,
-        YAMLDataclassExtraFieldsError,
-        Parser,
-        SimpleParser,
-    )
-)
+__all__ = [
+    "Converter",
+    "ConverterRegistry",
+    "DataclassConverter",
+    "types",
+    "YAMLConstructorError",
+    "YAMLRepresenterError",
+    "YAMLConversionError",
+    "YAMLParserError",
+    "YAMLDataclassFieldError",
+    "YAMLDataclassMissingFieldsError",
+    "YAMLDataclassExtraFieldsError",
+    "Parser",
+    "SimpleParser",
+]
@@ -12,17 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import abc
 import sys
 from collections.abc import Callable, Iterable
 from dataclasses import _MISSING_TYPE, dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     TypeVar,
-    cast,
     overload,
 )
 
@@ -31,15 +31,10 @@ if TYPE_CHECKING:
 
     from .parsers import Parser
 
-try:
-    from yaml import CDumper as Dumper
-    from yaml import CSafeLoader as Loader
-except ImportError:
-    from yaml import SafeDumper as Dumper
-    from yaml import SafeLoader as Loader
-
 from .types import (
     CollectionNode,
+    Dumper,
+    Loader,
     MappingNode,
     Node,
     Representer,
@@ -69,7 +64,7 @@ _Parser = TypeVar(
 )
 
 
-class Converter(abc.ABC, Generic[_Convertable, _Parser]):
+class Converter(Generic[_Convertable, _Parser]):
     """
     Defines how to convert between a yaml tag and a python type, intended
     to be subclassed and used in parser registries. For example::
@@ -91,30 +86,72 @@ class Converter(abc.ABC, Generic[_Convertable, _Parser]):
         print(wrap_parser.parse_str("data: !Wrap yum"))
     """
 
+    __slots__ = ("tag", "typ", "_base_constructor", "_base_representer")
+
+    _CONSTRUCT_DISPATCH: ClassVar[dict[type[Node], str]] = {
+        MappingNode: "construct_mapping",
+        SequenceNode: "construct_sequence",
+        ScalarNode: "construct_scalar",
+        CollectionNode: "construct_collection",
+    }
+    "Construct method for each node type, keyed on the exact node type"
+
     def __init__(self, *, tag: str, typ: type[_Convertable]):
         self.tag = tag
         self.typ = typ
 
     def bind_loader(self, loader: type[Loader]):
         self._base_constructor = loader.yaml_constructors.get(self.tag, None)
-        loader.yaml_constructors[self.tag] = self.construct
+        loader.yaml_constructors[self.tag] = self._specialise_construct()
 
     def bind_dumper(self, dumper: type[Dumper]):
         self._base_representer = dumper.yaml_representers.get(self.typ, None)
-        dumper.yaml_representers[self.typ] = self.represent
+        dumper.yaml_representers[self.typ] = self._specialise_represent()
 
     def construct(self, loader: Loader, node: Node):
-        match node:
-            case MappingNode():
-                return self.construct_mapping(loader, node)
-            case SequenceNode():
-                return self.construct_sequence(loader, node)
-            case ScalarNode():
-                return self.construct_scalar(loader, node)
-            case CollectionNode():
-                return self.construct_collection(loader, node)
-            case _:
-                return self.construct_node(loader, node)
+        method = self._CONSTRUCT_DISPATCH.get(type(node), "construct_node")
+        return getattr(self, method)(loader, node)
+
+    def _specialise_construct(self) -> Callable[[Loader, Node], Any]:
+        """
+        Build the constructor to bind to a loader, equivalent to `construct`
+        but dispatching directly to only the construct methods which this
+        converter overrides, since the rest fall through to `construct_node`.
+        """
+        if type(self).construct is not Converter.construct:
+            return self.construct
+        dispatch = {
+            node_typ: getattr(self, method)
+            for node_typ, method in self._CONSTRUCT_DISPATCH.items()
+            if getattr(type(self), method) is not getattr(Converter, method)
+        }
+        construct_node = self.construct_node
+        if not dispatch:
+            return construct_node
+        if len(dispatch) == 1:
+            ((only_typ, only_method),) = dispatch.items()
+
+            def construct_one(loader: Loader, node: Node):
+                if type(node) is only_typ:
+                    return only_method(loader, node)
+                return construct_node(loader, node)
+
+            return construct_one
+        get_method = dispatch.get
+
+        def construct(loader: Loader, node: Node):
+            return get_method(type(node), construct_node)(loader, node)
+
+        return construct
+
+    def _specialise_represent(self) -> Callable[[Representer, Any], Node]:
+        """
+        Get the representer to bind to a dumper, skipping the indirection
+        through `represent` unless this converter overrides it.
+        """
+        if type(self).represent is Converter.represent:
+            return self.represent_node
+        return self.represent
 
     def represent(self, representer: Representer, value: _Convertable):
         return self.represent_node(representer, value)
@@ -156,38 +193,64 @@ class ImplicitConverter(Converter[_Convertable, _Parser]):
     checks to be imposed on the data beyond standard YAML syntax.
     """
 
+    __slots__ = ("_base_constructors", "_base_representers")
+
+    def intercepts(self, tag: str | None) -> bool:
+        """
+        Whether construction of a tag should be routed through this converter,
+        other tags are left to be constructed directly by their existing
+        constructor. Subclasses which only check some tags should override
+        this to leave the rest alone. The `None` tag is the fallback for any
+        tag with no registered constructor.
+
+        :param tag: The yaml tag
+        :returns:   True if the tag should be routed through this converter
+        """
+        return True
+
     def bind_loader(self, loader: type[Loader]):
-        self._base_constructors: dict[str, Callable] = {}
-        for tag, constructor in loader.yaml_constructors.items():
-            self._base_constructors[tag] = constructor
-            loader.yaml_constructors[tag] = self.construct
+        self._base_constructors: dict[str | None, Callable] = dict(loader.yaml_constructors)
+        construct = self._specialise_construct()
+        for tag in self._base_constructors:
+            if self.intercepts(tag):
+                loader.yaml_constructors[tag] = construct
 
     def bind_dumper(self, dumper: type[Dumper]):
-        self._base_representers: dict[type, Callable] = {}
-        for typ, representer in dumper.yaml_representers.items():
-            self._base_representers[typ] = representer
-            dumper.yaml_representers[typ] = self.represent
+        self._base_representers: dict[type, Callable] = dict(dumper.yaml_representers)
+        represent = self._specialise_represent()
+        for typ in self._base_representers:
+            dumper.yaml_representers[typ] = represent
 
     def construct_node(self, loader: Loader, node: Node) -> _Convertable:
-        if constructor := self._base_constructors.get(node.tag, None):
-            return constructor(loader, node)
-        raise YAMLConstructorError(
-            f"Can't construct `{node.tag}` as it has no registered converter."
-            " If it is meant to be a string, it requires quotes, otherwise a"
-            " converter will need to be registered.",
-            context_mark=node.start_mark,
-        )
+        try:
+            constructor = self._base_constructors[node.tag]
+        except KeyError:
+            raise YAMLConstructorError(
+                f"Can't construct `{node.tag}` as it has no registered converter."
+                " If it is meant to be a string, it requires quotes, otherwise a"
+                " converter will need to be registered.",
+                context_mark=node.start_mark,
+            ) from None
+        return constructor(loader, node)
 
     def represent_node(self, representer: Representer, value: _Convertable) -> _Convertable:
-        if base_representer := self._base_representers.get(type(value), None):
-            return base_representer(representer, value)
-        raise YAMLRepresenterError(
-            f"Can't represent `{value}` as it has no registered converter."
-            " A converter will need to be registered."
-        )
+        if (base_representer := self._base_representers.get(type(value), None)) is None:
+            raise YAMLRepresenterError(
+                f"Can't represent `{value}` as it has no registered converter."
+                " A converter will need to be registered."
+            )
+        return base_representer(representer, value)
+
+
+_MAPPING_TAGS = frozenset(("tag:yaml.org,2002:map", "tag:yaml.org,2002:set"))
+_BOOL_TAG = "tag:yaml.org,2002:bool"
+_NUMBER_TAGS = frozenset(("tag:yaml.org,2002:int", "tag:yaml.org,2002:float"))
+_TRUE_FALSE = frozenset(("true", "false"))
+_CHECKED_TAGS = _MAPPING_TAGS | _NUMBER_TAGS | {_BOOL_TAG}
+_CONSTRUCT_METHODS = ("construct", "construct_node", *Converter._CONSTRUCT_DISPATCH.values())
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StrictImplicitConverter(ImplicitConverter[_Convertable, _Parser]):
     """
     Converter for values which are implicitly converted, with stricter checking
@@ -201,31 +264,57 @@ class StrictImplicitConverter(ImplicitConverter[_Convertable, _Parser]):
     strict_numbers: bool = True
     "Disallow sexagesimal number (e.g. 42:45)"
 
+    def intercepts(self, tag: str | None) -> bool:
+        # Only the checkable tags need intercepting, unless a subclass changes
+        # how other nodes are constructed. These are intercepted whether or
+        # not their check is enabled, as the flags can change after binding.
+        typ = type(self)
+        if typ is not StrictImplicitConverter and any(
+            getattr(typ, method) is not getattr(StrictImplicitConverter, method)
+            for method in _CONSTRUCT_METHODS
+        ):
+            return True
+        return tag is None or tag in _CHECKED_TAGS
+
     def construct_mapping(self, loader: Loader, node: MappingNode) -> _Convertable:
-        if self.strict_keys:
-            seen = []
+        if self.strict_keys and len(node.value) > 1:
+            seen = set()
+            # Unhashable keys are rare, so are checked separately by equality
+            seen_unhashable = []
+            seen_add = seen.add
             for key, _ in node.value:
                 key = self.construct_node(loader, key)
-                if key in seen:
+                # A key is a duplicate if adding it doesn't grow the set,
+                # which saves a separate membership test
+                size = len(seen)
+                try:
+                    seen_add(key)
+                    duplicate = len(seen) == size
+                except TypeError:
+                    duplicate = key in seen_unhashable
+                    seen_unhashable.append(key)
+                if duplicate:
                     raise YAMLConstructorError(
                         f"Duplicate key '{key}' detected in mapping",
                         context_mark=node.start_mark,
                     )
-                seen.append(key)
-        return super().construct_mapping(loader, node)
+        # Note, zero-argument super() doesn't work in slotted dataclasses
+        return super(StrictImplicitConverter, self).construct_mapping(loader, node)  # noqa: UP008
 
     def construct_scalar(self, loader: Loader, node: ScalarNode) -> Any:
-        value = super().construct_scalar(loader, node)
-        if self.strict_bools:
-            if isinstance(value, bool) and node.value.lower() not in ("true", "false"):
+        value = super(StrictImplicitConverter, self).construct_scalar(loader, node)  # noqa: UP008
+        # Scalar constructors return exact types, so avoid isinstance
+        typ = type(value)
+        if typ is bool:
+            if self.strict_bools and node.value.lower() not in _TRUE_FALSE:
                 raise YAMLConstructorError(
                     f"Unsafe bool '{node.value}' detected. Use `true` or"
                     " `false` for bools, or quote if it is intended to be"
                     " a string.",
                     context_mark=node.start_mark,
                 )
-        if self.strict_numbers:
-            if isinstance(value, int | float) and ":" in node.value:
+        elif typ is int or typ is float:
+            if self.strict_numbers and ":" in node.value:
                 raise YAMLConstructorError(
                     f"Unsafe number '{node.value}' detected. This is"
                     " probably meant to be a string, please quote it.",
@@ -234,6 +323,30 @@ class StrictImplicitConverter(ImplicitConverter[_Convertable, _Parser]):
         return value
 
 
+def _resolve_registration(
+    converter_convertable: Any, convertable_converter: Any, tag: str | None
+) -> tuple[str, Any, type[Converter]]:
+    """
+    Resolve the arguments of a `register` decorator, which can either be
+    called with the converter and decorate the convertable type, or be
+    called with the convertable type and decorate the converter.
+
+    :param converter_convertable: The type passed to `register`
+    :param convertable_converter: The decorated type
+    :param tag:                   The explicit yaml tag, if provided
+    :returns:                     The tag, convertable type, and converter
+    """
+    if issubclass(converter_convertable, Converter):
+        converter = converter_convertable
+        convertable = convertable_converter
+    else:
+        convertable = converter_convertable
+        converter = convertable_converter
+    # Intern tags so that the same tag registered across parsers is shared
+    inner_tag = sys.intern(f"!{convertable.__name__}" if tag is None else tag)
+    return inner_tag, convertable, converter
+
+
 class ConverterRegistry:
     """
     Creates an object with which to register converters which
@@ -245,6 +358,8 @@ class ConverterRegistry:
         self._registered_tags: set[str] = set()
         self._registered_typs: set[Any] = set()
         self._registry: list[tuple[str, Any, type[Converter]]] = []
+        self._frozen: tuple[dict[Any, Callable], dict[Any, Callable]] | None = None
+        "Constructor and representer tables built from this registry by a parser"
 
     def __iter__(self):
         yield from self._registry
@@ -283,14 +398,9 @@ class ConverterRegistry:
         """
 
         def wrap(convertable_converter, /):
-            if issubclass(converter_convertable, Converter):
-                converter = converter_convertable
-                convertable = convertable_converter
-            else:
-                convertable = converter_convertable
-                converter = convertable_converter
-
-            inner_tag = f"!{convertable.__name__}" if tag is None else tag
+            inner_tag, convertable, converter = _resolve_registration(
+                converter_convertable, convertable_converter, tag
+            )
 
             if inner_tag in self._registered_tags:
                 raise RuntimeError(f"Converter already exists for tag `{inner_tag}`")
@@ -299,6 +409,7 @@ class ConverterRegistry:
                 raise RuntimeError(f"Converter already exists for type `{convertable}`")
 
             self._registry.append((inner_tag, convertable, converter))
+            self._frozen = None
             return convertable_converter
 
         return wrap
@@ -316,48 +427,81 @@ class YAMLDataclassFieldError(YAMLConversionError):
 
 class YAMLDataclassMissingFieldsError(YAMLConversionError):
     def __init__(self, location: str, fields: Iterable[str]):
+        # The message is only formatted if it's asked for, as these errors
+        # are often caught without being displayed
+        self.location = location
         self.fields = fields
-        super().__init__(location, f"Missing field(s) `{', '.join(map(str, self.fields))}`")
+
+    @property
+    def msg(self) -> str:
+        return f"Missing field(s) `{', '.join(map(str, self.fields))}`"
 
 
 class YAMLDataclassExtraFieldsError(YAMLConversionError):
     def __init__(self, location: str, fields: Iterable[str]):
+        self.location = location
         self.fields = fields
-        super().__init__(location, f"Got extra field(s) `{', '.join(map(str, self.fields))}`")
+
+    @property
+    def msg(self) -> str:
+        return f"Got extra field(s) `{', '.join(map(str, self.fields))}`"
+
+
+@lru_cache(maxsize=1024)
+def _decompose_dataclass(
+    typ: type,
+) -> tuple[tuple[str, ...], frozenset[str], frozenset[str]]:
+    """
+    Get the field names of a dataclass, along with the subset which are
+    required (i.e. have no default), cached per dataclass type.
+
+    :param typ: The dataclass type
+    :returns:   Field names in definition order, all field names, and
+                required field names
+    """
+    keys = []
+    required_keys = set()
+    for typ_field in fields(typ):
+        keys.append(typ_field.name)
+        if isinstance(typ_field.default, _MISSING_TYPE) and isinstance(
+            typ_field.default_factory, _MISSING_TYPE
+        ):
+            required_keys.add(typ_field.name)
+    return tuple(keys), frozenset(keys), frozenset(required_keys)
 
 
 class DataclassConverter(Converter["_DataclassT", _Parser]):
+    __slots__ = ("_decomposed",)
+
+    def __init__(self, *, tag: str, typ: type["_DataclassT"]):
+        super().__init__(tag=tag, typ=typ)
+        # Decomposed on first use, as the type may be registered before
+        # @dataclass has processed it
+        self._decomposed: tuple[tuple[str, ...], frozenset[str], frozenset[str]] | None = None
+
+    def _decompose(self) -> tuple[tuple[str, ...], frozenset[str], frozenset[str]]:
+        "Get the field names of the dataclass, see `_decompose_dataclass`"
+        if (decomposed := self._decomposed) is None:
+            decomposed = self._decomposed = _decompose_dataclass(self.typ)
+        return decomposed
+
+    @staticmethod
+    def _format_location(node: Node) -> str:
+        "Format the location of a node for error messages"
+        mark = node.start_mark
+        return f"{Path(mark.name).absolute()}:{mark.line}:{mark.column}"
+
     def construct_mapping(self, loader: Loader, node: MappingNode) -> "_DataclassT":
-        loc = ":".join(
-            map(
-                str,
-                (
-                    Path(node.start_mark.name).absolute(),
-                    node.start_mark.line,
-                    node.start_mark.column,
-                ),
-            )
-        )
-        node_dict = cast(dict[str, Any], loader.construct_mapping(node, deep=True))
-
-        # Get some info from the fields
-        required_keys = set()
-        keys = set()
-        for field in fields(self.typ):
-            keys.add(field.name)
-            if isinstance(field.default, _MISSING_TYPE) and isinstance(
-                field.default_factory, _MISSING_TYPE
-            ):
-                required_keys.add(field.name)
+        node_dict: dict[str, Any] = loader.construct_mapping(node, deep=True)
+        _, field_names, required_field_names = self._decompose()
 
         # Check there are no extra fields provided
-        if extra := set(node_dict.keys()) - set(keys):
-            raise YAMLDataclassExtraFieldsError(loc, extra)
+        if extra := node_dict.keys() - field_names:
+            raise YAMLDataclassExtraFieldsError(self._format_location(node), extra)
 
         # Check there are no missing fields
-        missing = set(required_keys) - set(node_dict.keys())
-        if missing:
-            raise YAMLDataclassMissingFieldsError(loc, missing)
+        if missing := required_field_names - node_dict.keys():
+            raise YAMLDataclassMissingFieldsError(self._format_location(node), missing)
 
         try:
             # Create the dataclass instance
@@ -366,9 +510,16 @@ class DataclassConverter(Converter["_DataclassT", _Parser]):
             # Note, might be nice to add some heuristics to get the location
             # based on the field error
             sys.tracebacklimit = 0
-            raise YAMLDataclassFieldError(loc, ex, getattr(ex, "field", None)) from None
+            raise YAMLDataclassFieldError(
+                self._format_location(node), ex, getattr(ex, "field", None)
+            ) from None
 
         return instance
 
     def represent_node(self, representer: Representer, value: "_DataclassT") -> Node:
-        return representer.represent_mapping(self.tag, value.__dict__)
+        # Read fields by name rather than through __dict__, which slotted
+        # dataclasses don't have
+        ordered_field_names, _, _ = self._decompose()
+        return representer.represent_mapping(
+            self.tag, {name: getattr(value, name) for name in ordered_field_names}
+        )
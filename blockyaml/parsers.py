@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Iterable
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, Generic, Self, TextIO, overload
 
-from yaml import dump, load
+from yaml import dump, dump_all, load, load_all
 
 from .converters import (
     Converter,
@@ -24,6 +26,7 @@ from .converters import (
     ImplicitConverter,
     StrictImplicitConverter,
     _Convertable,
+    _resolve_registration,
 )
 from .types import Dumper, Loader, YAMLError
 
@@ -39,30 +42,77 @@ class YAMLParserError(YAMLError):
         return f"{self.location}: {self.msg}"
 
 
+_PathLike = Path | str | os.PathLike[str]
+
+_FILE_BUFFER_SIZE = 1 << 20
+"Buffer size for file reads and writes, libyaml otherwise reads in small chunks"
+
+
+def _load_file(path: Path, loader: type[Loader]) -> Any:
+    # Read bytes and leave decoding to libyaml rather than a text wrapper
+    with path.open("rb", buffering=_FILE_BUFFER_SIZE) as fh:
+        return load(fh, Loader=loader)
+
+
+class _ParseCache:
+    """
+    Least-recently-used cache of parsed YAML, keyed on the YAML string for
+    strings, and on the path, modification time and size for files.
+    """
+
+    def __init__(self, loader: type[Loader], maxsize: int = 2048):
+        self.loader = loader
+        self.load_str = lru_cache(maxsize=maxsize)(self._load_str)
+        self._load_file_stat = lru_cache(maxsize=maxsize)(self._load_file)
+
+    def _load_str(self, data: str) -> Any:
+        return load(data, Loader=self.loader)
+
+    def _load_file(self, path: Path, mtime_ns: int, size: int) -> Any:
+        return _load_file(path, self.loader)
+
+    def load_file(self, path: Path) -> Any:
+        stat = path.stat()
+        return self._load_file_stat(path, stat.st_mtime_ns, stat.st_size)
+
+    def clear(self) -> None:
+        self.load_str.cache_clear()
+        self._load_file_stat.cache_clear()
+
+
 class ObjectParser(Generic[_Convertable]):
     """Yaml parser for a specific type, created by ParserFactory"""
 
-    def __init__(self, typ: type[_Convertable], loader: type[Loader], dumper: type[Dumper]):
+    def __init__(
+        self,
+        typ: type[_Convertable],
+        loader: type[Loader],
+        dumper: type[Dumper],
+        cache: _ParseCache | None = None,
+    ):
         self.typ = typ
         self.loader = loader
         self.dumper = dumper
+        self.cache = cache
 
-    def parse(self, path: Path | TextIO) -> _Convertable:
+    def parse(self, path: _PathLike | TextIO) -> _Convertable:
         """
         Parse a YAML file from disk and return the object it contains.
 
         :param path: Where to read the yaml from
         :returns:    Parsed object
         """
-        if isinstance(path, Path):
-            epath = path
-            with path.open("r", encoding="utf-8") as fh:
-                parsed: _Convertable = load(fh, Loader=self.loader)
+        if isinstance(path, str | os.PathLike):
+            epath = Path(path)
+            if self.cache is None:
+                parsed: _Convertable = _load_file(epath, self.loader)
+            else:
+                parsed: _Convertable = self.cache.load_file(epath)
         else:
             epath = "<File Object>"
             parsed: _Convertable = load(path, Loader=self.loader)
 
-        if not isinstance(parsed, self.typ):
+        if self.typ is not object and not isinstance(parsed, self.typ):
             raise YAMLParserError(epath, f"Expected {self.typ} object got {type(parsed).__name__}")
         return parsed
 
@@ -73,15 +123,58 @@ class ObjectParser(Generic[_Convertable]):
         :param data: YAML string
         :returns:    Parsed object
         """
-        parsed: _Convertable = load(data, Loader=self.loader)
-        if not isinstance(parsed, self.typ):
+        if self.cache is None:
+            parsed: _Convertable = load(data, Loader=self.loader)
+        else:
+            parsed: _Convertable = self.cache.load_str(data)
+        if self.typ is not object and not isinstance(parsed, self.typ):
             raise YAMLParserError(
                 "<unicode string>",
                 f"Expected {self.typ} object got {type(parsed).__name__}",
             )
         return parsed
 
-    def dump(self, obj: Any, path: Path | TextIO) -> None:
+    def parse_all(self, path: _PathLike | TextIO) -> list[_Convertable]:
+        """
+        Parse a multi-document YAML file from disk and return the objects it
+        contains.
+
+        :param path: Where to read the yaml from
+        :returns:    Parsed objects, one per document
+        """
+        if isinstance(path, str | os.PathLike):
+            epath = Path(path)
+            with epath.open("rb", buffering=_FILE_BUFFER_SIZE) as fh:
+                parsed: list[_Convertable] = list(load_all(fh, Loader=self.loader))
+        else:
+            epath = "<File Object>"
+            parsed: list[_Convertable] = list(load_all(path, Loader=self.loader))
+        self._check_all(epath, parsed)
+        return parsed
+
+    def parse_all_str(self, data: str) -> list[_Convertable]:
+        """
+        Parse a multi-document YAML string and return the objects it contains.
+        A single loader is used for the whole stream, which is cheaper than
+        parsing each document separately.
+
+        :param data: YAML string
+        :returns:    Parsed objects, one per document
+        """
+        parsed: list[_Convertable] = list(load_all(data, Loader=self.loader))
+        self._check_all("<unicode string>", parsed)
+        return parsed
+
+    def _check_all(self, location: Path | str, parsed: list[Any]) -> None:
+        if self.typ is object:
+            return
+        for obj in parsed:
+            if not isinstance(obj, self.typ):
+                raise YAMLParserError(
+                    location, f"Expected {self.typ} object got {type(obj).__name__}"
+                )
+
+    def dump(self, obj: Any, path: _PathLike | TextIO) -> None:
         """
         Dump an object to YAML and write it to the path or file handle
         provided.
@@ -89,9 +182,9 @@ class ObjectParser(Generic[_Convertable]):
         :param obj:  The object to dump
         :param path: Where to write the YAML to
         """
-        if isinstance(path, Path):
-            with path.open("w", encoding="utf-8") as fh:
-                dump(obj, fh, Dumper=self.dumper)
+        if isinstance(path, str | os.PathLike):
+            with Path(path).open("wb", buffering=_FILE_BUFFER_SIZE) as fh:
+                dump(obj, fh, Dumper=self.dumper, encoding="utf-8")
         else:
             dump(obj, path, Dumper=self.dumper)
 
@@ -104,6 +197,56 @@ class ObjectParser(Generic[_Convertable]):
         """
         return dump(obj, Dumper=self.dumper)
 
+    def dump_all(self, objs: Iterable[Any], path: _PathLike | TextIO) -> None:
+        """
+        Dump objects as a multi-document YAML stream and write it to the path
+        or file handle provided.
+
+        :param objs: The objects to dump
+        :param path: Where to write the YAML to
+        """
+        if isinstance(path, str | os.PathLike):
+            with Path(path).open("wb", buffering=_FILE_BUFFER_SIZE) as fh:
+                dump_all(objs, fh, Dumper=self.dumper, encoding="utf-8")
+        else:
+            dump_all(objs, path, Dumper=self.dumper)
+
+    def dump_all_str(self, objs: Iterable[Any]) -> str:
+        """
+        Convert the objects into a multi-document YAML stream and return it
+        as a string
+
+        :param objs: The objects to dump
+        :returns:    The rendered YAML string
+        """
+        return dump_all(objs, Dumper=self.dumper)
+
+
+_EMPTY_REGISTRY = ConverterRegistry()
+
+
+def _can_freeze(registry: ConverterRegistry) -> bool:
+    """
+    Whether the constructor and representer tables built from a registry
+    capture everything binding its converters does. This isn't the case if
+    any converter customises binding, e.g. to add multi-constructors or
+    implicit resolvers to the loader.
+
+    :param registry: The registry to check
+    :returns:        True if the built tables can be reused by later parsers
+    """
+    implicit_converter = registry._implicit_converter
+    if implicit_converter is not None and (
+        type(implicit_converter).bind_loader is not ImplicitConverter.bind_loader
+        or type(implicit_converter).bind_dumper is not ImplicitConverter.bind_dumper
+    ):
+        return False
+    return all(
+        converter.bind_loader is Converter.bind_loader
+        and converter.bind_dumper is Converter.bind_dumper
+        for _, _, converter in registry
+    )
+
 
 class Parser:
     """
@@ -126,12 +269,22 @@ class Parser:
         # Parse as any registered type
         spacial_parser.parse_str(...)
 
+    Parsed results can be cached by creating the parser with ``cache=True``,
+    in which case repeated parses of the same string, or of an unmodified
+    file, return the same shared object. Cached objects must therefore not be
+    mutated by the caller.
+
+    Parsers built from the same registry (or with the default configuration)
+    share the converter instances bound by the first of them, including the
+    implicit converter, unless a converter customises binding. Converters
+    should therefore not hold state specific to one parser.
     """
 
     def __init__(
         self,
         registry: ConverterRegistry | None = None,
         implicit_converter: ImplicitConverter | None = None,
+        cache: bool = False,
     ):
         class _Loader(Loader):
             ...
@@ -141,8 +294,10 @@ class Parser:
 
         self.loader = _Loader
         self.dumper = _Dumper
+        self._cache = _ParseCache(self.loader) if cache else None
+        self._object_parsers: dict[Any, ObjectParser] = {}
+        self._generic_parser = self(object)
 
-        # Bind a primitive converter
         reg_implicit_converter = registry and registry._implicit_converter
         if implicit_converter and reg_implicit_converter:
             raise ValueError(
@@ -150,16 +305,42 @@ class Parser:
                 " primitive converter, but only one can"
                 " be specified!"
             )
-        implicit_converter = implicit_converter or reg_implicit_converter
-        if implicit_converter is None:
-            implicit_converter = StrictImplicitConverter()
 
-        implicit_converter.bind_loader(self.loader)
-        implicit_converter.bind_dumper(self.dumper)
+        # Reuse the tables built from the registry by an earlier parser where
+        # possible, rather than binding every converter again. Parsers with
+        # the default configuration share the tables of an empty registry.
+        # The tables hold the bound converter instances, so these are shared
+        # between the parsers too.
+        if registry is None and implicit_converter is None:
+            registry = _EMPTY_REGISTRY
+        freeze = registry is not None and implicit_converter is None and _can_freeze(registry)
+        if freeze and registry._frozen is not None:
+            constructors, representers = registry._frozen
+            _Loader.yaml_constructors = dict(constructors)
+            _Dumper.yaml_representers = dict(representers)
+        else:
+            # Take copies of the constructor and representer tables so that
+            # binding converters doesn't modify them for every other loader/dumper
+            _Loader.yaml_constructors = dict(Loader.yaml_constructors)
+            _Dumper.yaml_representers = dict(Dumper.yaml_representers)
+
+            # Bind a primitive converter
+            implicit_converter = implicit_converter or reg_implicit_converter
+            if implicit_converter is None:
+                implicit_converter = StrictImplicitConverter()
+
+            implicit_converter.bind_loader(self.loader)
+            implicit_converter.bind_dumper(self.dumper)
+
+            if registry is not None:
+                for tag, typ, converter in registry:
+                    self.register(converter, tag=tag)(typ)
 
-        if registry is not None:
-            for tag, typ, converter in registry:
-                self.register(converter, tag=tag)(typ)
+            if freeze:
+                registry._frozen = (
+                    dict(_Loader.yaml_constructors),
+                    dict(_Dumper.yaml_representers),
+                )
 
     @overload
     def register(
@@ -192,37 +373,47 @@ class Parser:
         """
 
         def wrap(convertable_converter, /):
-            if issubclass(converter_convertable, Converter):
-                converter = converter_convertable
-                convertable = convertable_converter
-            else:
-                convertable = converter_convertable
-                converter = convertable_converter
-            inner_tag = f"!{convertable.__name__}" if tag is None else tag
+            inner_tag, convertable, converter = _resolve_registration(
+                converter_convertable, convertable_converter, tag
+            )
             converter_inst = converter(tag=inner_tag, typ=convertable)
             converter_inst.bind_loader(self.loader)
             converter_inst.bind_dumper(self.dumper)
+            # Results parsed before this registration may now be wrong
+            self.clear_cache()
             return convertable_converter
 
         return wrap
 
     def __call__(self, typ: type[_Convertable]) -> ObjectParser[_Convertable]:
         """
-        Create a parser for a specific object
+        Get a parser for a specific object, which is created on first use and
+        then reused for the same object type
 
         :param dc:   object to parse as
         :returns:    object Parser
         """
-        return ObjectParser(typ, loader=self.loader, dumper=self.dumper)
+        if (object_parser := self._object_parsers.get(typ, None)) is None:
+            object_parser = self._object_parsers[typ] = ObjectParser(
+                typ, loader=self.loader, dumper=self.dumper, cache=self._cache
+            )
+        return object_parser
 
-    def parse(self, path: Path | TextIO) -> Any:
+    def clear_cache(self) -> None:
+        """
+        Clear any cached parse results
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def parse(self, path: _PathLike | TextIO) -> Any:
         """
         Parse a YAML file from disk and return the object it contains.
 
         :param path: Path to the YAML file to parse
         :returns:    Parsed dataclass object
         """
-        return self(object).parse(path)
+        return self._generic_parser.parse(path)
 
     def parse_str(self, data: str) -> Any:
         """
@@ -231,9 +422,28 @@ class Parser:
         :param data: YAML string
         :returns:    Parsed dataclass object
         """
-        return self(object).parse_str(data)
+        return self._generic_parser.parse_str(data)
+
+    def parse_all(self, path: _PathLike | TextIO) -> list[Any]:
+        """
+        Parse a multi-document YAML file from disk and return the objects it
+        contains.
+
+        :param path: Path to the YAML file to parse
+        :returns:    Parsed objects, one per document
+        """
+        return self._generic_parser.parse_all(path)
+
+    def parse_all_str(self, data: str) -> list[Any]:
+        """
+        Parse a multi-document YAML string and return the objects it contains.
+
+        :param data: YAML string
+        :returns:    Parsed objects, one per document
+        """
+        return self._generic_parser.parse_all_str(data)
 
-    def dump(self, obj: Any, path: Path | TextIO) -> None:
+    def dump(self, obj: Any, path: _PathLike | TextIO) -> None:
         """
         Dump an object to YAML and write it to the path or file handle
         provided.
@@ -241,7 +451,7 @@ class Parser:
         :param obj:  The object to dump
         :param path: Where to write the YAML to
         """
-        self(object).dump(obj, path)
+        self._generic_parser.dump(obj, path)
 
     def dump_str(self, obj: Any) -> str:
         """
@@ -250,15 +460,37 @@ class Parser:
         :param obj: The object to dump
         :returns:   The rendered YAML string
         """
-        return self(object).dump_str(obj)
+        return self._generic_parser.dump_str(obj)
+
+    def dump_all(self, objs: Iterable[Any], path: _PathLike | TextIO) -> None:
+        """
+        Dump objects as a multi-document YAML stream and write it to the path
+        or file handle provided.
+
+        :param objs: The objects to dump
+        :param path: Where to write the YAML to
+        """
+        self._generic_parser.dump_all(objs, path)
+
+    def dump_all_str(self, objs: Iterable[Any]) -> str:
+        """
+        Convert the objects into a multi-document YAML stream and return it
+        as a string
+
+        :param objs: The objects to dump
+        :returns:    The rendered YAML string
+        """
+        return self._generic_parser.dump_all_str(objs)
 
 
+@cache
 def SimpleParser(  # noqa: N802
     typ: type[_Convertable],
     Converter: type[Converter[_Convertable, Parser]],  # noqa: N803
 ) -> ObjectParser[_Convertable]:
     """
-    Create a parser for a specific object
+    Create a parser for a specific object, the same parser is returned for
+    repeated calls with the same object and converter types.
     """
     parser = Parser()
     parser.register(Converter)(typ)
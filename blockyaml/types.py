@@ -1,27 +1,39 @@
-try:
+import os
+
+import yaml
+
+# The pure-python loader and dumper are an order of magnitude slower than the
+# libyaml bindings, so only fall back to them when explicitly allowed.
+if yaml.__with_libyaml__:
     from yaml import CSafeDumper as Dumper
     from yaml import CSafeLoader as Loader
-except ImportError:
+elif os.environ.get("BLOCKYAML_ALLOW_PURE_PYTHON", "0") == "1":
     from yaml import SafeDumper as Dumper
     from yaml import SafeLoader as Loader
+else:
+    raise ImportError(
+        "PyYAML was not built with libyaml bindings (CSafeLoader/CSafeDumper)."
+        " Install libyaml headers and reinstall PyYAML, e.g."
+        " `pip install --no-binary pyyaml --force-reinstall pyyaml`, or set"
+        " BLOCKYAML_ALLOW_PURE_PYTHON=1 to use the slower pure-python"
+        " implementation."
+    )
 
 from yaml import CollectionNode, MappingNode, Node, ScalarNode, SequenceNode, YAMLError
 from yaml.constructor import ConstructorError as YAMLConstructorError
 from yaml.representer import BaseRepresenter as Representer
 from yaml.representer import RepresenterError as YAMLRepresenterError
 
-assert all(
-    (
-        Dumper,
-        Loader,
-        Representer,
-        Node,
-        MappingNode,
-        SequenceNode,
-        ScalarNode,
-        CollectionNode,
-        YAMLError,
-        YAMLConstructorError,
-        YAMLRepresenterError,
-    )
-)
+__all__ = [
+    "Dumper",
+    "Loader",
+    "Representer",
+    "Node",
+    "MappingNode",
+    "SequenceNode",
+    "ScalarNode",
+    "CollectionNode",
+    "YAMLError",
+    "YAMLConstructorError",
+    "YAMLRepresenterError",
+]
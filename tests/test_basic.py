@@ -12,55 +12,79 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
+from collections import OrderedDict, namedtuple
 from dataclasses import dataclass
+from enum import Enum, IntEnum
+from functools import cache
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
+import yaml
 
+import blockyaml.types
 from blockyaml import (
     Converter,
+    ConverterRegistry,
     DataclassConverter,
     Parser,
+    SimpleParser,
     YAMLConstructorError,
     YAMLDataclassExtraFieldsError,
     YAMLDataclassMissingFieldsError,
     YAMLParserError,
     YAMLRepresenterError,
 )
+from blockyaml.converters import StrictImplicitConverter
 
 
-def fixup(yml):
+@cache
+def fixup(yml: str) -> str:
     return dedent(yml).lstrip()
 
 
-class TestBasic:
-    def test_native_types(self):
-        parser = Parser()
+@pytest.fixture(scope="module")
+def parser():
+    "Parser shared by tests which don't register any converters on it"
+    return Parser()
 
-        assert parser.parse_str("hello") == "hello"
-        assert parser.parse_str("4") == 4
-        assert parser.parse_str("4.2") == 4.2
-        assert parser.parse_str("4.2.1") == "4.2.1"
-        assert parser.parse_str("True") is True
-        assert parser.parse_str(
-            """
+
+class TestBasic:
+    def test_native_types(self, parser):
+        docs = parser.parse_all_str(
+            fixup(
+                """
+            hello
+            --- 4
+            --- 4.2
+            --- 4.2.1
+            --- True
+            ---
             k0: 4
             k1: hi
-        """
-        ) == {"k0": 4, "k1": "hi"}
-        assert parser.parse_str(
-            """
+            ---
             - 4
             - hi
-        """
-        ) == [4, "hi"]
-        assert parser.parse_str(
-            """
+            ---
             - 4
             - x: 0
               y: [1]
-        """
-        ) == [4, {"x": 0, "y": [1]}]
+            """
+            )
+        )
+        assert docs == [
+            "hello",
+            4,
+            4.2,
+            "4.2.1",
+            True,
+            {"k0": 4, "k1": "hi"},
+            [4, "hi"],
+            [4, {"x": 0, "y": [1]}],
+        ]
+        assert docs[4] is True
+        assert parser.parse_str("4") == 4
 
     def test_tags(self):
         parser = Parser()
@@ -75,6 +99,8 @@ class TestBasic:
 
         # Test converter registry
         class Rect:
+            __slots__ = ("x", "y")
+
             def __init__(self, x: int, y: int):
                 self.x = x
                 self.y = y
@@ -94,7 +120,7 @@ class TestBasic:
         y: 4
         """
         rect = parser(Rect).parse_str(rectyaml)
-        assert rect.x == 2 and rect.y == 4
+        assert (rect.x, rect.y) == (2, 4)
         assert parser.dump_str(rect) == fixup(rectyaml)
 
     def test_errors(self):
@@ -124,9 +150,28 @@ class TestBasic:
         with pytest.raises(YAMLRepresenterError):
             parser.dump_str(Unregistered())
 
-    def test_strict_implicit_converter(self):
-        parser = Parser()
+    def test_subclass_representation(self, parser):
+        class Count(int):
+            ...
+
+        class Record(dict):
+            ...
+
+        class Colour(str, Enum):
+            RED = "red"
+
+        class Level(IntEnum):
+            LOW = 1
+
+        Pair = namedtuple("Pair", "x y")
 
+        # Test subclasses of natively supported types aren't silently
+        # represented as their base type, losing their type on a round trip
+        for value in (Count(4), Record(k0=4), Colour.RED, Level.LOW, OrderedDict(k0=4), Pair(1, 2)):
+            with pytest.raises(YAMLRepresenterError):
+                parser.dump_str(value)
+
+    def test_strict_implicit_converter(self, parser):
         with pytest.raises(YAMLConstructorError):
             parser.parse_str(
                 """
@@ -145,12 +190,99 @@ class TestBasic:
         with pytest.raises(YAMLConstructorError):
             parser.parse_str("!.html")
 
-    def test_dataclass_converter(self):
+        # Test checks can be toggled after the parser has been created
+        converter = StrictImplicitConverter(
+            strict_keys=False, strict_bools=False, strict_numbers=False
+        )
+        toggled_parser = Parser(implicit_converter=converter)
+        assert toggled_parser.parse_str("no") is False
+        assert toggled_parser.parse_str("{a: 1, a: 2}") == {"a": 2}
+        converter.strict_bools = True
+        converter.strict_keys = True
+        with pytest.raises(YAMLConstructorError):
+            toggled_parser.parse_str("no")
+        with pytest.raises(YAMLConstructorError):
+            toggled_parser.parse_str("{a: 1, a: 2}")
+
+        # Test subclasses can override construction of unchecked nodes
+        class TupleImplicitConverter(StrictImplicitConverter):
+            def construct_sequence(self, loader, node):
+                return tuple(loader.construct_sequence(node, deep=True))
+
+        tuple_parser = Parser(implicit_converter=TupleImplicitConverter())
+        assert tuple_parser.parse_str("[1, [2]]") == (1, (2,))
+        with pytest.raises(YAMLConstructorError):
+            tuple_parser.parse_str("no")
+
+    def test_parser_isolation(self):
+        parser = Parser()
+
+        @parser.register(str, tag="!Isolated")
+        class Isolated(Converter):
+            def construct_scalar(self, loader, node):
+                return node.value
+
+        # Test converters don't leak into other parsers or into PyYAML
+        assert parser.parse_str("!Isolated x") == "x"
+        with pytest.raises(YAMLConstructorError):
+            Parser().parse_str("!Isolated x")
+        assert yaml.safe_load("no") is False
+
+    def test_registry(self):
+        registry = ConverterRegistry()
+
+        @registry.register(DataclassConverter)
+        @dataclass
+        class Point:
+            x: int
+            y: int
+
+        # Test parsers built from the same registry behave the same
+        for parser in (Parser(registry), Parser(registry)):
+            point = parser.parse_str("!Point {x: 1, y: 2}")
+            assert isinstance(point, Point) and (point.x, point.y) == (1, 2)
+            with pytest.raises(YAMLConstructorError):
+                parser.parse_str("no")
+
+        # Test later registrations are picked up by new parsers
+        @registry.register(DataclassConverter)
+        @dataclass
+        class Size:
+            w: int
+
+        assert isinstance(Parser(registry).parse_str("!Size {w: 1}"), Size)
+
+        # Test registering on one parser doesn't affect another
+        parser = Parser(registry)
+
+        @parser.register(str, tag="!Local")
+        class Local(Converter):
+            def construct_scalar(self, loader, node):
+                return node.value
+
+        assert parser.parse_str("!Local x") == "x"
+        with pytest.raises(YAMLConstructorError):
+            Parser(registry).parse_str("!Local x")
+
+        # Test converters which customise binding work for every parser
+        class Env:
+            ...
+
+        @registry.register(Env)
+        class EnvConverter(Converter):
+            def bind_loader(self, loader):
+                super().bind_loader(loader)
+                loader.add_multi_constructor("!env:", lambda loader, suffix, node: f"${suffix}")
+
+        for parser in (Parser(registry), Parser(registry)):
+            assert parser.parse_str("!env:HOME") == "$HOME"
+
+    def test_dataclass_converter(self, tmp_path, monkeypatch):
         parser = Parser()
 
         # Test a dataclass converter
         @parser.register(DataclassConverter)
-        @dataclass
+        @dataclass(slots=True)
         class Date:
             week: int
             month: str
@@ -165,7 +297,7 @@ class TestBasic:
         """
         date = parser.parse_str(dateyaml)
         assert isinstance(date, Date)
-        assert date.day == 4 and date.week == 1 and date.month == "June"
+        assert (date.day, date.week, date.month) == (4, 1, "June")
         assert parser.dump_str(date) == fixup(dateyaml)
 
         # Test missing field with default
@@ -176,10 +308,10 @@ class TestBasic:
         week: 1
         """
         )
-        assert date.day == 3 and date.week == 1 and date.month == "June"
+        assert (date.day, date.week, date.month) == (3, 1, "June")
 
         # Test missing field without default
-        with pytest.raises(YAMLDataclassMissingFieldsError):
+        with pytest.raises(YAMLDataclassMissingFieldsError, match="Missing field.*week"):
             date = parser.parse_str(
                 """
             !Date
@@ -188,7 +320,7 @@ class TestBasic:
             )
 
         # Test extra field
-        with pytest.raises(YAMLDataclassExtraFieldsError):
+        with pytest.raises(YAMLDataclassExtraFieldsError, match="extra field.*hour"):
             date = parser.parse_str(
                 """
             !Date
@@ -203,3 +335,96 @@ class TestBasic:
             parser(Date).parse_str("hello")
 
         assert isinstance(parser(Date).parse_str(dateyaml), Date)
+        assert parser(Date) is parser(Date)
+
+        # Test registering before the dataclass decorator is applied
+        @dataclass
+        @parser.register(DataclassConverter)
+        class Time:
+            hour: int
+
+        time = parser.parse_str("!Time {hour: 4}")
+        assert isinstance(time, Time) and time.hour == 4
+        assert parser.dump_str(time) == "!Time\nhour: 4\n"
+
+        # Test error locations of relative paths follow the working directory
+        for subdir in ("a", "b"):
+            (tmp_path / subdir).mkdir()
+            monkeypatch.chdir(tmp_path / subdir)
+            Path("date.yaml").write_text("!Date {month: June}")
+            with pytest.raises(YAMLDataclassMissingFieldsError) as exc_info:
+                parser.parse("date.yaml")
+            assert exc_info.value.location.startswith(str(tmp_path / subdir / "date.yaml"))
+
+    def test_simple_parser(self):
+        @dataclass
+        class Coord:
+            x: int
+            y: int
+
+        parser = SimpleParser(Coord, DataclassConverter)
+        assert parser.parse_str("!Coord {x: 1, y: 2}") == Coord(1, 2)
+
+        # Test the parser is reused for the same arguments
+        assert SimpleParser(Coord, DataclassConverter) is parser
+
+    def test_files(self, parser, tmp_path):
+        path = tmp_path / "data.yaml"
+
+        # Test round-tripping through a file, including non-ascii text
+        parser.dump({"k0": "h\u00e9llo", "k1": [1, 2]}, path)
+        assert parser.parse(path) == {"k0": "h\u00e9llo", "k1": [1, 2]}
+        with path.open("r", encoding="utf-8") as fh:
+            assert parser.parse(fh) == {"k0": "h\u00e9llo", "k1": [1, 2]}
+
+        # Test string paths are accepted
+        parser.dump([1, 2], str(path))
+        assert parser.parse(str(path)) == [1, 2]
+
+        # Test dumping multiple documents
+        docs = [{"k0": 1}, [2], "three"]
+        assert parser.parse_all_str(parser.dump_all_str(docs)) == docs
+        parser.dump_all(docs, path)
+        assert parser.parse_all(path) == docs
+        with pytest.raises(YAMLParserError):
+            parser(dict).parse_all(path)
+
+    def test_parse_cache(self, tmp_path):
+        parser = Parser(cache=True)
+
+        # Test repeated string parses share a result
+        parsed = parser.parse_str("k0: [1, 2]")
+        assert parser.parse_str("k0: [1, 2]") is parsed
+        assert parser.parse_str("k0: [1, 3]") is not parsed
+
+        # Test the cache can be cleared
+        parser.clear_cache()
+        assert parser.parse_str("k0: [1, 2]") is not parsed
+
+        # Test file parses are invalidated on modification
+        path = tmp_path / "cached.yaml"
+        path.write_text("k0: 1")
+        parsed = parser.parse(path)
+        assert parser.parse(path) is parsed
+        path.write_text("k0: 10")
+        assert parser.parse(path) == {"k0": 10}
+
+        # Test the cache is off by default
+        parser = Parser()
+        assert parser.parse_str("k0: [1, 2]") is not parser.parse_str("k0: [1, 2]")
+
+    def test_pure_python_fallback(self, monkeypatch):
+        monkeypatch.setattr(yaml, "__with_libyaml__", False)
+        monkeypatch.delenv("BLOCKYAML_ALLOW_PURE_PYTHON", raising=False)
+        try:
+            # Test a missing libyaml is an error by default
+            with pytest.raises(ImportError, match="libyaml"):
+                importlib.reload(blockyaml.types)
+
+            # Test the pure-python implementation can be opted into
+            monkeypatch.setenv("BLOCKYAML_ALLOW_PURE_PYTHON", "1")
+            types = importlib.reload(blockyaml.types)
+            assert (types.Loader, types.Dumper) == (yaml.SafeLoader, yaml.SafeDumper)
+        finally:
+            monkeypatch.undo()
+            importlib.reload(blockyaml.types)